@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import aiosqlite
-from datetime import datetime
+from datetime import UTC, datetime
 
 DB_PATH: str = "bot.db"
 
@@ -57,43 +57,71 @@ CREATE TABLE IF NOT EXISTS metrics_daily (
 
 CREATE INDEX IF NOT EXISTS idx_undo_actions_token ON undo_actions(token);
 CREATE INDEX IF NOT EXISTS idx_events_user_status_dt ON events(user_id, status, event_dt);
+CREATE INDEX IF NOT EXISTS idx_events_status ON events(status);
+CREATE INDEX IF NOT EXISTS idx_jobs_event_id ON jobs(event_id);
 CREATE INDEX IF NOT EXISTS idx_metrics_day ON metrics_daily(day_utc);
 """
 
+# Long-lived connections, one per database path. Opening a connection per
+# query pays file open + WAL check + statement-cache setup on every call;
+# SQLite is single-writer and aiosqlite serializes, so one connection is safe.
+_connections: dict[str, aiosqlite.Connection] = {}
+
+
+async def _get_conn(path: str | None = None) -> aiosqlite.Connection:
+    key = path or DB_PATH
+    conn = _connections.get(key)
+    if conn is None:
+        conn = aiosqlite.connect(key)
+        # aiosqlite connections run a worker thread; make it a daemon so a
+        # pooled connection never blocks interpreter shutdown.
+        conn.daemon = True
+        conn = await conn
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        _connections[key] = conn
+    return conn
 
-async def init_db(path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.executescript(SCHEMA)
-        await conn.commit()
 
+async def init_db(path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.executescript(SCHEMA)
+    await conn.commit()
+
+
+async def get_connection(path: str | None = None) -> aiosqlite.Connection:
+    return await _get_conn(path)
 
-async def get_connection(path: str = DB_PATH) -> aiosqlite.Connection:
-    conn = await aiosqlite.connect(path)
-    conn.row_factory = aiosqlite.Row
-    return conn
+
+async def close_db() -> None:
+    """Close all pooled connections (call once at shutdown)."""
+    while _connections:
+        _, conn = _connections.popitem()
+        await conn.close()
 
 
 # ── Users ──────────────────────────────────────────
 
-async def get_user(user_id: int, path: str = DB_PATH) -> dict | None:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        row = await cur.fetchone()
-        if row:
-            return dict(row)
-        return None
-
-
-async def upsert_user(user_id: int, timezone: str, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute(
-            """INSERT INTO users (user_id, timezone, created_at)
-               VALUES (?, ?, ?)
-               ON CONFLICT(user_id) DO UPDATE SET timezone = excluded.timezone""",
-            (user_id, timezone, datetime.utcnow().isoformat()),
-        )
-        await conn.commit()
+async def get_user(user_id: int, path: str | None = None) -> dict | None:
+    conn = await _get_conn(path)
+    cur = await conn.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
+    row = await cur.fetchone()
+    if row:
+        return dict(row)
+    return None
+
+
+async def upsert_user(user_id: int, timezone: str, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute(
+        """INSERT INTO users (user_id, timezone, created_at)
+           VALUES (?, ?, ?)
+           ON CONFLICT(user_id) DO UPDATE SET timezone = excluded.timezone""",
+        (user_id, timezone, datetime.now(UTC).isoformat(timespec="seconds")),
+    )
+    await conn.commit()
 
 
 # ── Events ─────────────────────────────────────────
@@ -103,89 +131,90 @@ async def create_event(
     event_dt: str,
     activity: str,
     notes: str | None,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> int:
-    async with aiosqlite.connect(path) as conn:
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        """INSERT INTO events (user_id, event_dt, activity, notes, created_at, status, snooze_count)
+           VALUES (?, ?, ?, ?, ?, 'active', 0)""",
+        (user_id, event_dt, activity, notes, datetime.now(UTC).isoformat(timespec="seconds")),
+    )
+    await conn.commit()
+    return cur.lastrowid  # type: ignore[return-value]
+
+
+async def get_event(event_id: int, path: str | None = None, only_active: bool = False) -> dict | None:
+    conn = await _get_conn(path)
+    if only_active:
         cur = await conn.execute(
-            """INSERT INTO events (user_id, event_dt, activity, notes, created_at, status, snooze_count)
-               VALUES (?, ?, ?, ?, ?, 'active', 0)""",
-            (user_id, event_dt, activity, notes, datetime.utcnow().isoformat()),
+            "SELECT * FROM events WHERE id = ? AND status = 'active'", (event_id,)
         )
-        await conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
-
-
-async def get_event(event_id: int, path: str = DB_PATH) -> dict | None:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
+    else:
         cur = await conn.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    row = await cur.fetchone()
+    return dict(row) if row else None
 
 
 async def get_active_event_for_user(
     event_id: int,
     user_id: int,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> dict | None:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute(
-            "SELECT * FROM events WHERE id = ? AND user_id = ? AND status = 'active'",
-            (event_id, user_id),
-        )
-        row = await cur.fetchone()
-        return dict(row) if row else None
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        "SELECT * FROM events WHERE id = ? AND user_id = ? AND status = 'active'",
+        (event_id, user_id),
+    )
+    row = await cur.fetchone()
+    return dict(row) if row else None
 
 
-async def update_event_status(event_id: int, status: str, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute("UPDATE events SET status = ? WHERE id = ?", (status, event_id))
-        await conn.commit()
+async def update_event_status(event_id: int, status: str, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute("UPDATE events SET status = ? WHERE id = ?", (status, event_id))
+    await conn.commit()
 
 
-async def update_event_datetime(event_id: int, event_dt: str, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute("UPDATE events SET event_dt = ? WHERE id = ?", (event_dt, event_id))
-        await conn.commit()
+async def update_event_datetime(event_id: int, event_dt: str, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute("UPDATE events SET event_dt = ? WHERE id = ?", (event_dt, event_id))
+    await conn.commit()
 
 
-async def update_event_activity(event_id: int, activity: str, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute("UPDATE events SET activity = ? WHERE id = ?", (activity, event_id))
-        await conn.commit()
+async def update_event_activity(event_id: int, activity: str, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute("UPDATE events SET activity = ? WHERE id = ?", (activity, event_id))
+    await conn.commit()
 
 
-async def update_event_notes(event_id: int, notes: str | None, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute("UPDATE events SET notes = ? WHERE id = ?", (notes, event_id))
-        await conn.commit()
+async def update_event_notes(event_id: int, notes: str | None, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute("UPDATE events SET notes = ? WHERE id = ?", (notes, event_id))
+    await conn.commit()
 
 
-async def increment_snooze(event_id: int, path: str = DB_PATH) -> int:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        await conn.execute(
-            "UPDATE events SET snooze_count = snooze_count + 1 WHERE id = ?", (event_id,)
-        )
-        await conn.commit()
-        cur = await conn.execute("SELECT snooze_count FROM events WHERE id = ?", (event_id,))
-        row = await cur.fetchone()
-        return row["snooze_count"] if row else 0
+async def increment_snooze(event_id: int, path: str | None = None) -> int:
+    conn = await _get_conn(path)
+    await conn.execute(
+        "UPDATE events SET snooze_count = snooze_count + 1 WHERE id = ?", (event_id,)
+    )
+    await conn.commit()
+    cur = await conn.execute("SELECT snooze_count FROM events WHERE id = ?", (event_id,))
+    row = await cur.fetchone()
+    return row["snooze_count"] if row else 0
 
 
-async def get_week_events(user_id: int, start_dt: str, end_dt: str, path: str = DB_PATH) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute(
-            """SELECT * FROM events
-               WHERE user_id = ? AND status = 'active'
-                 AND event_dt >= ? AND event_dt <= ?
-               ORDER BY event_dt""",
-            (user_id, start_dt, end_dt),
-        )
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+async def get_week_events(user_id: int, start_dt: str, end_dt: str, path: str | None = None) -> list[aiosqlite.Row]:
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        """SELECT id, user_id, event_dt, activity, notes, created_at, status, snooze_count
+           FROM events
+           WHERE user_id = ? AND status = 'active'
+             AND event_dt >= ? AND event_dt <= ?
+           ORDER BY event_dt""",
+        (user_id, start_dt, end_dt),
+    )
+    return list(await cur.fetchall())
 
 
 async def count_events_by_filter(
@@ -193,24 +222,23 @@ async def count_events_by_filter(
     filter_name: str,
     start_dt: str,
     end_dt: str,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> int:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        if filter_name == "all":
-            cur = await conn.execute(
-                "SELECT COUNT(*) as cnt FROM events WHERE user_id = ? AND status = 'active'",
-                (user_id,),
-            )
-        else:
-            cur = await conn.execute(
-                """SELECT COUNT(*) as cnt FROM events
-                   WHERE user_id = ? AND status = 'active'
-                     AND event_dt >= ? AND event_dt <= ?""",
-                (user_id, start_dt, end_dt),
-            )
-        row = await cur.fetchone()
-        return int(row["cnt"]) if row else 0
+    conn = await _get_conn(path)
+    if filter_name == "all":
+        cur = await conn.execute(
+            "SELECT COUNT(*) as cnt FROM events WHERE user_id = ? AND status = 'active'",
+            (user_id,),
+        )
+    else:
+        cur = await conn.execute(
+            """SELECT COUNT(*) as cnt FROM events
+               WHERE user_id = ? AND status = 'active'
+                 AND event_dt >= ? AND event_dt <= ?""",
+            (user_id, start_dt, end_dt),
+        )
+    row = await cur.fetchone()
+    return int(row["cnt"]) if row else 0
 
 
 async def list_events_by_filter(
@@ -220,37 +248,40 @@ async def list_events_by_filter(
     end_dt: str | None,
     limit: int,
     offset: int,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        if filter_name == "all":
-            cur = await conn.execute(
-                """SELECT * FROM events
-                   WHERE user_id = ? AND status = 'active'
-                   ORDER BY event_dt
-                   LIMIT ? OFFSET ?""",
-                (user_id, limit, offset),
-            )
-        else:
-            cur = await conn.execute(
-                """SELECT * FROM events
-                   WHERE user_id = ? AND status = 'active'
-                     AND event_dt >= ? AND event_dt <= ?
-                   ORDER BY event_dt
-                   LIMIT ? OFFSET ?""",
-                (user_id, start_dt, end_dt, limit, offset),
-            )
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
-
-
-async def get_active_events(path: str = DB_PATH) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute("SELECT * FROM events WHERE status = 'active'")
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+    conn = await _get_conn(path)
+    # dt_display slices the stored local-time string directly; strftime()
+    # would normalize the +HH:MM offset away and shift the wall-clock time.
+    dt_display = (
+        "substr(event_dt, 9, 2) || '.' || substr(event_dt, 6, 2) || '.' || "
+        "substr(event_dt, 1, 4) || ' ' || substr(event_dt, 12, 5)"
+    )
+    if filter_name == "all":
+        cur = await conn.execute(
+            f"""SELECT *, {dt_display} AS dt_display FROM events
+               WHERE user_id = ? AND status = 'active'
+               ORDER BY event_dt
+               LIMIT ? OFFSET ?""",
+            (user_id, limit, offset),
+        )
+    else:
+        cur = await conn.execute(
+            f"""SELECT *, {dt_display} AS dt_display FROM events
+               WHERE user_id = ? AND status = 'active'
+                 AND event_dt >= ? AND event_dt <= ?
+               ORDER BY event_dt
+               LIMIT ? OFFSET ?""",
+            (user_id, start_dt, end_dt, limit, offset),
+        )
+    rows = await cur.fetchall()
+    return [dict(r) for r in rows]
+
+
+async def get_active_events(path: str | None = None) -> list[aiosqlite.Row]:
+    conn = await _get_conn(path)
+    cur = await conn.execute("SELECT * FROM events WHERE status = 'active'")
+    return list(await cur.fetchall())
 
 
 # ── Jobs ───────────────────────────────────────────
@@ -260,48 +291,67 @@ async def create_job(
     job_type: str,
     run_dt: str,
     scheduler_job_id: str,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> int:
-    async with aiosqlite.connect(path) as conn:
-        cur = await conn.execute(
-            """INSERT INTO jobs (event_id, job_type, run_dt, scheduler_job_id)
-               VALUES (?, ?, ?, ?)""",
-            (event_id, job_type, run_dt, scheduler_job_id),
-        )
-        await conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        """INSERT INTO jobs (event_id, job_type, run_dt, scheduler_job_id)
+           VALUES (?, ?, ?, ?)""",
+        (event_id, job_type, run_dt, scheduler_job_id),
+    )
+    await conn.commit()
+    return cur.lastrowid  # type: ignore[return-value]
+
+
+async def create_jobs_bulk(
+    rows: list[tuple[int, str, str, str]],
+    path: str | None = None,
+) -> None:
+    """Insert (event_id, job_type, run_dt, scheduler_job_id) rows in one transaction."""
+    conn = await _get_conn(path)
+    await conn.executemany(
+        """INSERT INTO jobs (event_id, job_type, run_dt, scheduler_job_id)
+           VALUES (?, ?, ?, ?)""",
+        rows,
+    )
+    await conn.commit()
 
 
-async def get_jobs_for_event(event_id: int, path: str = DB_PATH) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute("SELECT * FROM jobs WHERE event_id = ?", (event_id,))
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+async def get_jobs_for_event(event_id: int, path: str | None = None) -> list[aiosqlite.Row]:
+    conn = await _get_conn(path)
+    cur = await conn.execute("SELECT * FROM jobs WHERE event_id = ?", (event_id,))
+    return list(await cur.fetchall())
 
 
-async def delete_jobs_for_event(event_id: int, path: str = DB_PATH) -> list[str]:
+async def delete_jobs_for_event(event_id: int, path: str | None = None) -> list[str]:
     """Delete all jobs for an event; return scheduler_job_ids for cancellation."""
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute("SELECT scheduler_job_id FROM jobs WHERE event_id = ?", (event_id,))
-        rows = await cur.fetchall()
-        job_ids = [r["scheduler_job_id"] for r in rows]
-        await conn.execute("DELETE FROM jobs WHERE event_id = ?", (event_id,))
-        await conn.commit()
-        return job_ids
-
-
-async def get_all_jobs(path: str = DB_PATH) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        "DELETE FROM jobs WHERE event_id = ? RETURNING scheduler_job_id", (event_id,)
+    )
+    rows = await cur.fetchall()
+    await conn.commit()
+    return [r[0] for r in rows]
+
+
+async def get_all_jobs(path: str | None = None, after: str | None = None) -> list[aiosqlite.Row]:
+    conn = await _get_conn(path)
+    if after is None:
         cur = await conn.execute(
             """SELECT j.*, e.status as event_status
                FROM jobs j JOIN events e ON j.event_id = e.id
                WHERE e.status = 'active'"""
         )
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+    else:
+        # datetime() normalizes the stored offset to UTC, so rows written in
+        # different user timezones compare correctly against a UTC cutoff.
+        cur = await conn.execute(
+            """SELECT j.*, e.status as event_status
+               FROM jobs j JOIN events e ON j.event_id = e.id
+               WHERE e.status = 'active' AND datetime(j.run_dt) > datetime(?)""",
+            (after,),
+        )
+    return list(await cur.fetchall())
 
 
 # ── Undo actions ───────────────────────────────────
@@ -311,42 +361,41 @@ async def create_undo_action(
     user_id: int,
     token: str,
     expires_at: str,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> int:
-    async with aiosqlite.connect(path) as conn:
-        cur = await conn.execute(
-            """INSERT INTO undo_actions (token, event_id, user_id, expires_at, created_at, status)
-               VALUES (?, ?, ?, ?, ?, 'active')""",
-            (token, event_id, user_id, expires_at, datetime.utcnow().isoformat()),
-        )
-        await conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        """INSERT INTO undo_actions (token, event_id, user_id, expires_at, created_at, status)
+           VALUES (?, ?, ?, ?, ?, 'active')""",
+        (token, event_id, user_id, expires_at, datetime.now(UTC).isoformat(timespec="seconds")),
+    )
+    await conn.commit()
+    return cur.lastrowid  # type: ignore[return-value]
 
 
-async def get_undo_action(token: str, path: str = DB_PATH) -> dict | None:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute("SELECT * FROM undo_actions WHERE token = ?", (token,))
-        row = await cur.fetchone()
-        return dict(row) if row else None
+async def get_undo_action(token: str, path: str | None = None) -> dict | None:
+    conn = await _get_conn(path)
+    cur = await conn.execute("SELECT * FROM undo_actions WHERE token = ?", (token,))
+    row = await cur.fetchone()
+    return dict(row) if row else None
 
 
-async def mark_undo_action_used(token: str, used_at: str, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute(
-            "UPDATE undo_actions SET status = 'used', used_at = ? WHERE token = ? AND status = 'active'",
-            (used_at, token),
-        )
-        await conn.commit()
+async def mark_undo_action_used(token: str, used_at: str, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute(
+        "UPDATE undo_actions SET status = 'used', used_at = ? WHERE token = ? AND status = 'active'",
+        (used_at, token),
+    )
+    await conn.commit()
 
 
-async def mark_undo_action_expired(token: str, path: str = DB_PATH) -> None:
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute(
-            "UPDATE undo_actions SET status = 'expired' WHERE token = ? AND status = 'active'",
-            (token,),
-        )
-        await conn.commit()
+async def mark_undo_action_expired(token: str, path: str | None = None) -> None:
+    conn = await _get_conn(path)
+    await conn.execute(
+        "UPDATE undo_actions SET status = 'expired' WHERE token = ? AND status = 'active'",
+        (token,),
+    )
+    await conn.commit()
 
 
 async def find_duplicate_events(
@@ -354,29 +403,28 @@ async def find_duplicate_events(
     event_dt: str,
     activity_norm: str,
     exclude_event_id: int | None = None,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        if exclude_event_id is None:
-            cur = await conn.execute(
-                """SELECT * FROM events
-                   WHERE user_id = ? AND status = 'active'
-                     AND event_dt = ?
-                     AND lower(trim(activity)) = ?""",
-                (user_id, event_dt, activity_norm),
-            )
-        else:
-            cur = await conn.execute(
-                """SELECT * FROM events
-                   WHERE user_id = ? AND status = 'active'
-                     AND event_dt = ?
-                     AND lower(trim(activity)) = ?
-                     AND id != ?""",
-                (user_id, event_dt, activity_norm, exclude_event_id),
-            )
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+    conn = await _get_conn(path)
+    if exclude_event_id is None:
+        cur = await conn.execute(
+            """SELECT * FROM events
+               WHERE user_id = ? AND status = 'active'
+                 AND event_dt = ?
+                 AND lower(trim(activity)) = ?""",
+            (user_id, event_dt, activity_norm),
+        )
+    else:
+        cur = await conn.execute(
+            """SELECT * FROM events
+               WHERE user_id = ? AND status = 'active'
+                 AND event_dt = ?
+                 AND lower(trim(activity)) = ?
+                 AND id != ?""",
+            (user_id, event_dt, activity_norm, exclude_event_id),
+        )
+    rows = await cur.fetchall()
+    return [dict(r) for r in rows]
 
 
 # ── Metrics ────────────────────────────────────────
@@ -384,25 +432,24 @@ async def find_duplicate_events(
 async def increment_metric(
     key: str,
     day_utc: str | None = None,
-    path: str = DB_PATH,
+    path: str | None = None,
 ) -> None:
-    day = day_utc or datetime.utcnow().date().isoformat()
-    async with aiosqlite.connect(path) as conn:
-        await conn.execute(
-            """INSERT INTO metrics_daily (day_utc, key, value)
-               VALUES (?, ?, 1)
-               ON CONFLICT(day_utc, key) DO UPDATE SET value = value + 1""",
-            (day, key),
-        )
-        await conn.commit()
-
-
-async def get_metrics_for_day(day_utc: str, path: str = DB_PATH) -> list[dict]:
-    async with aiosqlite.connect(path) as conn:
-        conn.row_factory = aiosqlite.Row
-        cur = await conn.execute(
-            "SELECT key, value FROM metrics_daily WHERE day_utc = ? ORDER BY key",
-            (day_utc,),
-        )
-        rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+    day = day_utc or datetime.now(UTC).date().isoformat()
+    conn = await _get_conn(path)
+    await conn.execute(
+        """INSERT INTO metrics_daily (day_utc, key, value)
+           VALUES (?, ?, 1)
+           ON CONFLICT(day_utc, key) DO UPDATE SET value = value + 1""",
+        (day, key),
+    )
+    await conn.commit()
+
+
+async def get_metrics_for_day(day_utc: str, path: str | None = None) -> list[dict]:
+    conn = await _get_conn(path)
+    cur = await conn.execute(
+        "SELECT key, value FROM metrics_daily WHERE day_utc = ? ORDER BY key",
+        (day_utc,),
+    )
+    rows = await cur.fetchall()
+    return [dict(r) for r in rows]
@@ -11,20 +11,33 @@ from .texts import MSG_DELETED, MSG_DONE, MSG_INVALID_ACTION, MSG_SNOOZE_LIMIT,
 router = Router()
 
 
-@router.callback_query(F.data.startswith("snooze:"))
-async def on_snooze(callback: CallbackQuery) -> None:
+async def _resolve_event(callback: CallbackQuery, prefix: str) -> tuple[int, dict] | None:
+    """Parse the event id after ``prefix`` and check ownership.
+
+    Answers the callback and returns None on a bad payload or when the
+    event does not belong to the calling user.
+    """
     user_id = callback.from_user.id  # type: ignore[union-attr]
     try:
-        event_id = int(callback.data.split(":")[1])  # type: ignore[union-attr]
+        event_id = int(callback.data[len(prefix):])  # type: ignore[index]
     except Exception:
         await bump_metric("callback_invalid_payload")
         await callback.answer(MSG_INVALID_ACTION, show_alert=True)
-        return
+        return None
     event = await database.get_active_event_for_user(event_id, user_id)
     if event is None:
         await bump_metric("ownership_reject")
         await callback.answer(MSG_UNAUTHORIZED, show_alert=True)
+        return None
+    return event_id, event
+
+
+async def on_snooze(callback: CallbackQuery) -> None:
+    user_id = callback.from_user.id  # type: ignore[union-attr]
+    resolved = await _resolve_event(callback, "snooze:")
+    if resolved is None:
         return
+    event_id, _ = resolved
 
     new_time = await schedule_snooze(event_id)
     if new_time:
@@ -46,20 +59,11 @@ async def on_snooze(callback: CallbackQuery) -> None:
             await callback.message.edit_reply_markup(reply_markup=kb)  # type: ignore[union-attr]
 
 
-@router.callback_query(F.data.startswith("done:"))
 async def on_done(callback: CallbackQuery) -> None:
-    user_id = callback.from_user.id  # type: ignore[union-attr]
-    try:
-        event_id = int(callback.data.split(":")[1])  # type: ignore[union-attr]
-    except Exception:
-        await bump_metric("callback_invalid_payload")
-        await callback.answer(MSG_INVALID_ACTION, show_alert=True)
-        return
-    event = await database.get_active_event_for_user(event_id, user_id)
-    if event is None:
-        await bump_metric("ownership_reject")
-        await callback.answer(MSG_UNAUTHORIZED, show_alert=True)
+    resolved = await _resolve_event(callback, "done:")
+    if resolved is None:
         return
+    event_id, _ = resolved
 
     await database.update_event_status(event_id, "done")
     await cancel_event_jobs(event_id)
@@ -68,23 +72,31 @@ async def on_done(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("delete:"))
 async def on_delete(callback: CallbackQuery) -> None:
-    user_id = callback.from_user.id  # type: ignore[union-attr]
-    try:
-        event_id = int(callback.data.split(":")[1])  # type: ignore[union-attr]
-    except Exception:
-        await bump_metric("callback_invalid_payload")
-        await callback.answer(MSG_INVALID_ACTION, show_alert=True)
-        return
-    event = await database.get_active_event_for_user(event_id, user_id)
-    if event is None:
-        await bump_metric("ownership_reject")
-        await callback.answer(MSG_UNAUTHORIZED, show_alert=True)
+    resolved = await _resolve_event(callback, "delete:")
+    if resolved is None:
         return
+    event_id, _ = resolved
 
     await database.update_event_status(event_id, "deleted")
     await cancel_event_jobs(event_id)
     await bump_metric("delete_performed")
     await callback.message.edit_reply_markup(reply_markup=None)  # type: ignore[union-attr]
     await callback.answer(MSG_DELETED)
+
+
+_ACTIONS = {
+    "snooze": on_snooze,
+    "done": on_done,
+    "delete": on_delete,
+}
+
+
+@router.callback_query(F.data.regexp(r"^(snooze|done|delete):"))
+async def on_event_action(callback: CallbackQuery) -> None:
+    """Single registration for the three reminder actions.
+
+    One filter evaluation per callback instead of three startswith
+    chains walked by the dispatcher.
+    """
+    await _ACTIONS[callback.data.partition(":")[0]](callback)  # type: ignore[union-attr]
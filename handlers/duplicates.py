@@ -6,9 +6,11 @@ import re
 
 import db as database
 
+_WS_RE = re.compile(r"\s+")
+
 
 def normalize_activity(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return _WS_RE.sub(" ", text.strip().lower())
 
 
 async def has_duplicate_event(
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from zoneinfo import ZoneInfo
 
 from aiogram import F, Router
 from aiogram.exceptions import TelegramBadRequest
+from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, KeyboardButton, Message, ReplyKeyboardMarkup, InlineKeyboardMarkup, InlineKeyboardButton
 
 import db as database
+from tz_cache import get_zone
 from scheduler import cancel_event_jobs, schedule_event_jobs
 from .calendar_core import (
     build_date_calendar_kb,
@@ -237,7 +238,7 @@ async def _apply_edit_datetime(
     if event is None:
         return False, MSG_UNAUTHORIZED
 
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     now = datetime.now(tz)
     new_dt = datetime(
         selected_date.year,
@@ -272,7 +273,7 @@ async def _apply_edit_datetime(
     await database.update_event_datetime(event_id, new_dt.isoformat())
     await database.update_event_notes(event_id, None)
     await cancel_event_jobs(event_id)
-    await schedule_event_jobs(event_id, new_dt, user_id)
+    await schedule_event_jobs(event_id, new_dt, user_id, now=now)
     await bump_metric("edit_success")
     if not data.get("return_to_browser"):
         await state.clear()
@@ -297,11 +298,16 @@ async def _complete_edit_result(
         await message.answer(text, reply_markup=MAIN_MENU)
 
 
-@router.message(EditEventStates.edit_menu, F.text.func(is_cancel_text))
-@router.message(EditEventStates.edit_waiting_calendar_date, F.text.func(is_cancel_text))
-@router.message(EditEventStates.edit_waiting_time, F.text.func(is_cancel_text))
-@router.message(EditEventStates.edit_confirm_duplicate, F.text.func(is_cancel_text))
-@router.message(EditEventStates.edit_waiting_activity, F.text.func(is_cancel_text))
+@router.message(
+    StateFilter(
+        EditEventStates.edit_menu,
+        EditEventStates.edit_waiting_calendar_date,
+        EditEventStates.edit_waiting_time,
+        EditEventStates.edit_confirm_duplicate,
+        EditEventStates.edit_waiting_activity,
+    ),
+    F.text.func(is_cancel_text),
+)
 async def cancel_edit_by_text(message: Message, state: FSMContext) -> None:
     await _complete_edit_result(
         message,
@@ -637,7 +643,7 @@ async def on_edit_time_callback(callback: CallbackQuery, state: FSMContext) -> N
             selected_date.day,
             hour,
             minute,
-            tzinfo=ZoneInfo(tz_name),
+            tzinfo=get_zone(tz_name),
         )
         summary = format_saved_summary(dt=new_dt, activity=event["activity"])
         await _complete_edit_result(
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from tz_cache import get_zone
 from .ui_tokens import CANCEL_TEXT, STYLE_DANGER
 
 
 def calendar_bounds(tz_name: str, *, days_ahead: int = 730) -> tuple[date, date]:
     """Return [today, today + days_ahead] in user timezone."""
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     today = datetime.now(tz).date()
     return today, today + timedelta(days=days_ahead)
 
@@ -6,11 +6,10 @@ import math
 import re
 import secrets
 from datetime import date, datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from aiogram import F, Router
 from aiogram.exceptions import TelegramBadRequest
-from aiogram.filters import Command
+from aiogram.filters import Command, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import (
@@ -21,6 +20,7 @@ from aiogram.types import (
 )
 
 import db as database
+from tz_cache import get_zone
 from scheduler import cancel_event_jobs, schedule_event_jobs
 from .calendar_core import (
     build_date_calendar_kb,
@@ -99,20 +99,19 @@ def _bounds_for_filter(filter_name: str, now: datetime) -> tuple[str | None, str
     if filter_name == "all":
         return None, None
 
+    if filter_name == "week":
+        # week = rolling window: now .. now+7 days
+        return now.isoformat(), (now + timedelta(days=7)).isoformat()
+
     start_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     end_today = now.replace(hour=23, minute=59, second=59, microsecond=0)
 
     if filter_name == "today":
         return start_today.isoformat(), end_today.isoformat()
 
-    if filter_name == "tomorrow":
-        start_tomorrow = start_today + timedelta(days=1)
-        end_tomorrow = end_today + timedelta(days=1)
-        return start_tomorrow.isoformat(), end_tomorrow.isoformat()
-
-    # week = rolling window: now .. now+7 days
-    end_week = now + timedelta(days=7)
-    return now.isoformat(), end_week.isoformat()
+    start_tomorrow = start_today + timedelta(days=1)
+    end_tomorrow = end_today + timedelta(days=1)
+    return start_tomorrow.isoformat(), end_tomorrow.isoformat()
 
 
 def _short_activity(text: str) -> str:
@@ -152,7 +151,7 @@ async def _build_browser_payload(
     filter_name: str,
     page: int,
 ) -> tuple[str, InlineKeyboardMarkup, int, int]:
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     now = datetime.now(tz)
     start_dt, end_dt = _bounds_for_filter(filter_name, now)
 
@@ -183,9 +182,12 @@ async def _build_browser_payload(
         lines.append(MSG_BROWSER_EMPTY)
     else:
         for idx, ev in enumerate(events, start=offset + 1):
-            dt = datetime.fromisoformat(ev["event_dt"])
+            dt_display = ev.get("dt_display")
+            if dt_display is None:
+                iso = ev["event_dt"]
+                dt_display = f"{iso[8:10]}.{iso[5:7]}.{iso[0:4]} {iso[11:16]}"
             lines.append(
-                f"{idx}. {dt.strftime('%d.%m.%Y %H:%M')}\n"
+                f"{idx}. {dt_display}\n"
                 f"Активность: {_short_activity(ev['activity'])}"
             )
             lines.append("")
@@ -666,7 +668,7 @@ async def _apply_clone_time(
         return False, MSG_STALE_CALENDAR
 
     selected_date = date.fromisoformat(selected_iso)
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     now = datetime.now(tz)
     dt = datetime(
         selected_date.year,
@@ -718,9 +720,14 @@ async def _finalize_clone(state: FSMContext, user_id: int) -> tuple[bool, str |
     return True, None
 
 
-@router.message(BrowserStates.clone_waiting_calendar_date, F.text.func(is_cancel_text))
-@router.message(BrowserStates.clone_waiting_time, F.text.func(is_cancel_text))
-@router.message(BrowserStates.clone_confirm, F.text.func(is_cancel_text))
+@router.message(
+    StateFilter(
+        BrowserStates.clone_waiting_calendar_date,
+        BrowserStates.clone_waiting_time,
+        BrowserStates.clone_confirm,
+    ),
+    F.text.func(is_cancel_text),
+)
 async def cancel_clone_by_text(message: Message, state: FSMContext) -> None:
     restored = await return_to_browser_context(
         message,
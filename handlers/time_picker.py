@@ -4,21 +4,22 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from tz_cache import get_zone
 from .ui_tokens import CANCEL_TEXT, DONE_TEXT, STYLE_DANGER, STYLE_PRIMARY, STYLE_SUCCESS
 
 _SID_RE = re.compile(r"^[0-9a-f]{8}$")
 
 
 def picker_initial_now(tz_name: str) -> tuple[int, int]:
-    now = datetime.now(ZoneInfo(tz_name))
+    now = datetime.now(get_zone(tz_name))
     return now.hour, now.minute
 
 
 def picker_initial_now_plus_1h(tz_name: str) -> tuple[int, int]:
-    now = datetime.now(ZoneInfo(tz_name)) + timedelta(hours=1)
+    now = datetime.now(get_zone(tz_name)) + timedelta(hours=1)
     return now.hour, now.minute
 
 
@@ -4,8 +4,9 @@ from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
+import zoneinfo
+
 from aiogram.types import Message, ReplyKeyboardMarkup, KeyboardButton
-from zoneinfo import ZoneInfo
 
 import db as database
 from .start import MAIN_MENU
@@ -29,10 +30,21 @@ class TZStates(StatesGroup):
     waiting_tz = State()
 
 
+# Known IANA names, loaded once; validating against this set avoids
+# constructing a ZoneInfo (tzdata read) just to see whether it raises.
+_TZ_NAMES = zoneinfo.available_timezones()
+
+
+# Static markup; built once instead of per /start / /tz message.
+_TZ_KEYBOARD = ReplyKeyboardMarkup(
+    keyboard=[[KeyboardButton(text=tz)] for tz in POPULAR_TZ]
+    + [[KeyboardButton(text="Отмена")]],
+    resize_keyboard=True,
+)
+
+
 def _tz_keyboard() -> ReplyKeyboardMarkup:
-    rows = [[KeyboardButton(text=tz)] for tz in POPULAR_TZ]
-    rows.append([KeyboardButton(text="Отмена")])
-    return ReplyKeyboardMarkup(keyboard=rows, resize_keyboard=True)
+    return _TZ_KEYBOARD
 
 
 async def ask_timezone(message: Message, state: FSMContext) -> None:
@@ -60,9 +72,7 @@ async def process_tz(message: Message, state: FSMContext) -> None:
         return
 
     tz_str = message.text.strip() if message.text else ""
-    try:
-        ZoneInfo(tz_str)
-    except (KeyError, ValueError):
+    if tz_str not in _TZ_NAMES:
         await message.answer(MSG_BAD_TZ)
         return
     user_id = message.from_user.id  # type: ignore[union-attr]
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from zoneinfo import ZoneInfo
 
 from aiogram import F, Router
 from aiogram.exceptions import TelegramBadRequest
+from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, KeyboardButton, Message, ReplyKeyboardMarkup
 
 import db as database
+from tz_cache import get_zone
 from scheduler import schedule_event_jobs
 from .calendar_core import (
     build_date_calendar_kb,
@@ -80,6 +81,24 @@ CANCEL_KB = ReplyKeyboardMarkup(
     resize_keyboard=True,
 )
 
+CONFIRM_KB = ReplyKeyboardMarkup(
+    keyboard=[
+        [KeyboardButton(text="Подтвердить")],
+        [KeyboardButton(text="Изменить")],
+        [KeyboardButton(text="Отмена")],
+    ],
+    resize_keyboard=True,
+)
+
+EDIT_CHOICE_KB = ReplyKeyboardMarkup(
+    keyboard=[
+        [KeyboardButton(text="Дата/время")],
+        [KeyboardButton(text="Активность")],
+        [KeyboardButton(text="Отмена")],
+    ],
+    resize_keyboard=True,
+)
+
 STEP_DATE = MSG_CALENDAR_STEP
 STEP_TIME = MSG_TIME_STEP
 
@@ -152,7 +171,7 @@ async def _apply_selected_time(
     except ValueError:
         return False, MSG_INVALID_DATE
 
-    tz = ZoneInfo(tz_name)
+    tz = get_zone(tz_name)
     now = datetime.now(tz)
     dt = datetime(
         selected_date.year,
@@ -185,11 +204,16 @@ async def start_wizard(message: Message, state: FSMContext) -> None:
     await _start_calendar_step(message, state, user["timezone"])
 
 
-@router.message(WizardStates.waiting_calendar_date, F.text.func(is_cancel_text))
-@router.message(WizardStates.waiting_time_after_calendar, F.text.func(is_cancel_text))
-@router.message(WizardStates.waiting_activity, F.text.func(is_cancel_text))
-@router.message(WizardStates.confirm, F.text.func(is_cancel_text))
-@router.message(WizardStates.edit_choice, F.text.func(is_cancel_text))
+@router.message(
+    StateFilter(
+        WizardStates.waiting_calendar_date,
+        WizardStates.waiting_time_after_calendar,
+        WizardStates.waiting_activity,
+        WizardStates.confirm,
+        WizardStates.edit_choice,
+    ),
+    F.text.func(is_cancel_text),
+)
 async def cancel_wizard(message: Message, state: FSMContext) -> None:
     await state.clear()
     await message.answer(MSG_CREATION_CANCELLED, reply_markup=MAIN_MENU)
@@ -472,10 +496,11 @@ async def process_activity(message: Message, state: FSMContext) -> None:
     if not text or len(text) > 200:
         await message.answer(MSG_ACTIVITY_LEN)
         return
-    await state.update_data(activity=text)
-    await state.set_state(WizardStates.confirm)
-    await state.update_data(create_dup_sid=None)
     data = await state.get_data()
+    data["activity"] = text
+    data["create_dup_sid"] = None
+    await state.set_data(data)
+    await state.set_state(WizardStates.confirm)
     await _show_confirmation(message, data)
 
 
@@ -486,22 +511,16 @@ async def _show_confirmation(message: Message, data: dict) -> None:
         activity=data["activity"],
         mode="create",
     )
-    kb = ReplyKeyboardMarkup(
-        keyboard=[
-            [KeyboardButton(text="Подтвердить")],
-            [KeyboardButton(text="Изменить")],
-            [KeyboardButton(text="Отмена")],
-        ],
-        resize_keyboard=True,
-    )
-    await message.answer(text, reply_markup=kb)
+    await message.answer(text, reply_markup=CONFIRM_KB)
 
 
 @router.message(WizardStates.confirm, F.text == "Подтвердить")
 async def confirm_event(message: Message, state: FSMContext) -> None:
     user_id = message.from_user.id  # type: ignore[union-attr]
     data_before = await state.get_data()
-    ok, error = await _finalize_create(state, user_id=user_id, duplicate_override=False)
+    ok, error = await _finalize_create(
+        state, user_id=user_id, duplicate_override=False, data=data_before
+    )
     if not ok and error == "DUPLICATE":
         data = await state.get_data()
         await bump_metric("duplicate_warning_shown")
@@ -527,8 +546,10 @@ async def _finalize_create(
     *,
     user_id: int,
     duplicate_override: bool,
+    data: dict | None = None,
 ) -> tuple[bool, str | None]:
-    data = await state.get_data()
+    if data is None:
+        data = await state.get_data()
     dt_iso = data.get("event_dt")
     activity = data.get("activity")
     if not dt_iso or not activity:
@@ -578,15 +599,15 @@ async def on_create_duplicate_decision(callback: CallbackQuery, state: FSMContex
         await state.update_data(create_dup_sid=None)
         await callback.answer()
         if callback.message:
-            data = await state.get_data()
+            data["create_dup_sid"] = None
             await _show_confirmation(callback.message, data)
         return
 
-    data_before = await state.get_data()
     ok, error = await _finalize_create(
         state,
         user_id=callback.from_user.id,  # type: ignore[union-attr]
         duplicate_override=True,
+        data=data,
     )
     if not ok:
         await callback.answer(error or MSG_INVALID_ACTION)
@@ -596,8 +617,8 @@ async def on_create_duplicate_decision(callback: CallbackQuery, state: FSMContex
     await callback.answer()
     if callback.message:
         summary = format_saved_summary(
-            dt=datetime.fromisoformat(data_before["event_dt"]),
-            activity=data_before["activity"],
+            dt=datetime.fromisoformat(data["event_dt"]),
+            activity=data["activity"],
         )
         await callback.message.answer(summary, reply_markup=MAIN_MENU)
 
@@ -605,15 +626,7 @@ async def on_create_duplicate_decision(callback: CallbackQuery, state: FSMContex
 @router.message(WizardStates.confirm, F.text == "Изменить")
 async def edit_choice(message: Message, state: FSMContext) -> None:
     await state.set_state(WizardStates.edit_choice)
-    kb = ReplyKeyboardMarkup(
-        keyboard=[
-            [KeyboardButton(text="Дата/время")],
-            [KeyboardButton(text="Активность")],
-            [KeyboardButton(text="Отмена")],
-        ],
-        resize_keyboard=True,
-    )
-    await message.answer(MSG_WHAT_TO_EDIT, reply_markup=kb)
+    await message.answer(MSG_WHAT_TO_EDIT, reply_markup=EDIT_CHOICE_KB)
 
 
 @router.message(WizardStates.edit_choice, F.text == "Дата/время")
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 # Ensure project root is on path
@@ -21,16 +23,28 @@ from scheduler import scheduler as apscheduler, set_bot, restore_jobs_on_startup
 from handlers import router as main_router
 
 
-def setup_logging() -> None:
+def setup_logging() -> QueueListener:
+    """Route log records through a queue so handler I/O never blocks the loop.
+
+    The async hot paths log from coroutines; a synchronous FileHandler would
+    block the event loop on every write. The QueueHandler formats the record
+    (basicConfig's format) and hands it off; the listener thread does the
+    actual stream/file I/O.
+    """
     fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
     logging.basicConfig(
         level=logging.INFO,
         format=fmt,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(LOG_FILE, encoding="utf-8"),
-        ],
+        handlers=[QueueHandler(log_queue)],
+    )
+    listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler(LOG_FILE, encoding="utf-8"),
     )
+    listener.start()
+    return listener
 
 
 def _validate_startup_config() -> None:
@@ -94,7 +108,7 @@ async def create_fsm_storage(redis_dsn: str, ttl_seconds: int):
 
 
 async def main() -> None:
-    setup_logging()
+    log_listener = setup_logging()
     logger = logging.getLogger(__name__)
     logger.info("Starting bot...")
 
@@ -119,6 +133,8 @@ async def main() -> None:
         apscheduler.shutdown()
         await dp.storage.close()
         await bot.session.close()
+        await database.close_db()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
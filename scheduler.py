@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 import logging
-import uuid
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+import os
+from datetime import datetime, timedelta, timezone
 
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 import db as database
+from tz_cache import get_zone
 
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
+UTC = get_zone("UTC")
+
+# Hard cap on per-event snoozes; the DB itself does not enforce it.
+MAX_SNOOZE = 25
+
 # Will be set by main.py at startup
 _bot = None
 _db_path: str = "bot.db"
@@ -37,36 +43,62 @@ def compute_job_times(
     - at_time: exact event time
     - for deltas <= 60 min: schedule only at_time
     """
-    jobs: list[tuple[str, datetime]] = []
-    delta = event_dt - now
+    secs = (event_dt - now).total_seconds()
 
-    if delta.total_seconds() <= 0:
-        return jobs
+    if secs <= 0:
+        return []
 
     # Near events must not produce parallel close reminders.
-    if delta.total_seconds() <= 3600:
+    if secs <= 3600:
         return [("at_time", event_dt)]
 
-    # day_before: run at 12:00 the day before event
+    # day_before runs at 12:00 the day before the event; hour_before is
+    # always in the future here since the event is more than an hour away.
     day_before_dt = (event_dt - timedelta(days=1)).replace(
         hour=12, minute=0, second=0, microsecond=0
     )
-    if day_before_dt > now:
-        jobs.append(("day_before", day_before_dt))
+    candidates = [
+        (day_before_dt > now, "day_before", day_before_dt),
+        (True, "hour_before", event_dt - timedelta(hours=1)),
+        (True, "at_time", event_dt),
+    ]
+    return [(job_type, run_dt) for ok, job_type, run_dt in candidates if ok]
 
-    # hour_before
-    hour_before_dt = event_dt - timedelta(hours=1)
-    if hour_before_dt > now and delta.total_seconds() > 3600:
-        jobs.append(("hour_before", hour_before_dt))
 
-    # at_time: fire at exact event time
-    jobs.append(("at_time", event_dt))
+def _make_job_id() -> str:
+    return f"reminder_{os.urandom(6).hex()}"
 
-    return jobs
 
+def _parse_iso_dt(s: str) -> datetime:
+    """Parse the fixed YYYY-MM-DDTHH:MM:SS[.ffffff][+HH:MM] layout we store.
 
-def _make_job_id() -> str:
-    return f"reminder_{uuid.uuid4().hex[:12]}"
+    All run_dt values are written by datetime.isoformat(), so the field
+    positions are fixed; slicing them out beats the general-purpose parser
+    when restoring thousands of jobs. Anything unexpected falls back to
+    datetime.fromisoformat.
+    """
+    try:
+        rest = s[19:]
+        micro = 0
+        if rest[:1] == ".":
+            micro = int(rest[1:7])
+            rest = rest[7:]
+        tz = None
+        if rest:
+            sign = 1 if rest[0] == "+" else -1
+            tz = timezone(sign * timedelta(hours=int(rest[1:3]), minutes=int(rest[4:6])))
+        return datetime(
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[14:16]), int(s[17:19]),
+            micro, tz,
+        )
+    except (ValueError, IndexError):
+        return datetime.fromisoformat(s)
+
+
+def _format_event_dt(iso: str) -> str:
+    """Render a stored YYYY-MM-DDTHH:MM:SS[+HH:MM] string as DD.MM.YYYY HH:MM."""
+    return f"{iso[8:10]}.{iso[5:7]}.{iso[0:4]} {iso[11:16]}"
 
 
 def _reminder_text(job_type: str, event: dict) -> str:
@@ -81,18 +113,14 @@ def _reminder_text(job_type: str, event: dict) -> str:
 
     lines = [f"{prefix}"]
     # Format date as DD.MM.YYYY HH:MM
-    event_dt = datetime.fromisoformat(event['event_dt'])
-    dt_formatted = event_dt.strftime("%d.%m.%Y %H:%M")
-    lines.append(f"Когда: {dt_formatted}")
+    lines.append(f"Когда: {_format_event_dt(event['event_dt'])}")
     lines.append(f"Активность: {event['activity']}")
     return "\n".join(lines)
 
 
 def _build_reminder_keyboard(event_id: int, snooze_count: int):
-    from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-
     buttons = []
-    if snooze_count < 25:
+    if snooze_count < MAX_SNOOZE:
         buttons.append(
             InlineKeyboardButton(
                 text="Отложить на 1 час",
@@ -109,8 +137,8 @@ def _build_reminder_keyboard(event_id: int, snooze_count: int):
 
 
 async def _send_reminder(event_id: int, job_type: str) -> None:
-    event = await database.get_event(event_id, path=_db_path)
-    if not event or event["status"] != "active":
+    event = await database.get_event(event_id, path=_db_path, only_active=True)
+    if not event:
         return
     text = _reminder_text(job_type, event)
     kb = _build_reminder_keyboard(event_id, event["snooze_count"])
@@ -131,6 +159,7 @@ async def schedule_event_jobs(event_id: int, event_dt: datetime, user_id: int, n
 
     job_specs = compute_job_times(event_dt, now)
 
+    rows: list[tuple[int, str, str, str]] = []
     for job_type, run_dt in job_specs:
         job_id = _make_job_id()
         scheduler.add_job(
@@ -140,30 +169,28 @@ async def schedule_event_jobs(event_id: int, event_dt: datetime, user_id: int, n
             args=[event_id, job_type],
             id=job_id,
         )
-        await database.create_job(
-            event_id=event_id,
-            job_type=job_type,
-            run_dt=run_dt.isoformat(),
-            scheduler_job_id=job_id,
-            path=_db_path,
-        )
-        logger.info("Scheduled %s for event %d at %s (job %s)", job_type, event_id, run_dt, job_id)
+        rows.append((event_id, job_type, run_dt.isoformat(), job_id))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Scheduled %s for event %d at %s (job %s)", job_type, event_id, run_dt, job_id)
+
+    if rows:
+        await database.create_jobs_bulk(rows, path=_db_path)
 
 
 async def schedule_snooze(event_id: int) -> datetime | None:
     """Snooze by +1 hour in user TZ by rescheduling the event timeline."""
-    event = await database.get_event(event_id, path=_db_path)
-    if not event or event["status"] != "active":
+    event = await database.get_event(event_id, path=_db_path, only_active=True)
+    if not event:
         return None
-    if event["snooze_count"] >= 25:
+    if event["snooze_count"] >= MAX_SNOOZE:
         return None
 
     new_count = await database.increment_snooze(event_id, path=_db_path)
-    if new_count > 25:
+    if new_count > MAX_SNOOZE:
         return None
 
     user = await database.get_user(event["user_id"], path=_db_path)
-    tz = ZoneInfo(user["timezone"]) if user else ZoneInfo("Europe/Moscow")
+    tz = get_zone(user["timezone"]) if user else get_zone("Europe/Moscow")
     now = datetime.now(tz)
     new_dt = now + timedelta(hours=1)
 
@@ -186,28 +213,35 @@ async def cancel_event_jobs(event_id: int) -> None:
 
 async def restore_jobs_on_startup() -> None:
     """Re-create scheduler jobs from DB for active events after restart."""
-    all_jobs = await database.get_all_jobs(path=_db_path)
-    now = datetime.now(ZoneInfo("UTC"))
-
-    for job in all_jobs:
-        run_dt = datetime.fromisoformat(job["run_dt"])
-        if run_dt.tzinfo is None:
-            run_dt = run_dt.replace(tzinfo=ZoneInfo("UTC"))
-        if run_dt <= now:
-            continue
-        try:
-            scheduler.add_job(
-                _send_reminder,
-                "date",
-                run_date=run_dt,
-                args=[job["event_id"], job["job_type"]],
-                id=job["scheduler_job_id"],
-            )
-            logger.info(
-                "Restored job %s for event %d at %s",
-                job["scheduler_job_id"],
-                job["event_id"],
-                run_dt,
-            )
-        except Exception:
-            logger.exception("Failed to restore job %s", job["scheduler_job_id"])
+    now = datetime.now(UTC)
+    all_jobs = await database.get_all_jobs(path=_db_path, after=now.isoformat())
+
+    restored = 0
+    # Each add_job wakes the scheduler loop; pause while bulk-adding so the
+    # wakeups coalesce into one on resume. Tests call this without starting
+    # the scheduler, hence the running guard.
+    if scheduler.running:
+        scheduler.pause()
+    try:
+        for job in all_jobs:
+            run_dt = _parse_iso_dt(job["run_dt"])
+            if run_dt.tzinfo is None:
+                run_dt = run_dt.replace(tzinfo=UTC)
+            if run_dt <= now:
+                continue
+            try:
+                scheduler.add_job(
+                    _send_reminder,
+                    "date",
+                    run_date=run_dt,
+                    args=[job["event_id"], job["job_type"]],
+                    id=job["scheduler_job_id"],
+                )
+                restored += 1
+            except Exception:
+                logger.exception("Failed to restore job %s", job["scheduler_job_id"])
+    finally:
+        if scheduler.running:
+            scheduler.resume()
+
+    logger.info("Restored %d jobs", restored)
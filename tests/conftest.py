@@ -1,13 +1,20 @@
 """Shared fixtures for tests."""
 
 import os
-import pytest
+import sys
+from zoneinfo import ZoneInfo
 
 # Override config to prevent sys.exit when no token
 os.environ.setdefault("TELEGRAM_BOT_TOKEN", "test_token_123")
 os.environ.setdefault("DB_PATH", ":memory:")
 
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
+# Shared timezone for tests that build Moscow-local datetimes.
+TZ = ZoneInfo("Europe/Moscow")
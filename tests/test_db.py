@@ -1,26 +1,51 @@
 """Integration tests for SQLite database layer."""
 
-import os
 import pytest
 import pytest_asyncio
-import tempfile
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import db as database
 
+EVT_DT = "2025-12-25T18:00:00+03:00"
+
 
 @pytest_asyncio.fixture
 async def db_path():
-    """Create a temporary database for each test."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
-    await database.init_db(path)
-    yield path
-    os.unlink(path)
-
-
-@pytest.mark.asyncio
+    """Fresh in-memory database for each test.
+
+    The pooled connection keeps the :memory: database alive for the
+    duration of the test; close_db() drops it, so every test starts from
+    a clean schema without touching disk.
+    """
+    await database.init_db(":memory:")
+    yield ":memory:"
+    await database.close_db()
+
+
+async def _seed_user_event(db_path: str) -> int:
+    """Insert the standard user + event pair the job tests build on."""
+    await database.upsert_user(111, "Europe/Moscow", path=db_path)
+    return await database.create_event(
+        user_id=111,
+        event_dt=EVT_DT,
+        activity="Test",
+        notes=None,
+        path=db_path,
+    )
+
+
+async def _bump_snooze(event_id: int, n: int, path: str) -> None:
+    """Jump snooze_count forward in one UPDATE instead of n increment calls."""
+    conn = await database.get_connection(path)
+    await conn.execute(
+        "UPDATE events SET snooze_count = snooze_count + ? WHERE id = ?",
+        (n, event_id),
+    )
+    await conn.commit()
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestUserCRUD:
     async def test_create_and_get_user(self, db_path):
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
@@ -40,13 +65,13 @@ class TestUserCRUD:
         assert user is None
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestEventCRUD:
     async def test_create_event(self, db_path):
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Meeting",
             notes="Some notes",
             path=db_path,
@@ -61,7 +86,7 @@ class TestEventCRUD:
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Test",
             notes=None,
             path=db_path,
@@ -74,7 +99,7 @@ class TestEventCRUD:
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Test",
             notes=None,
             path=db_path,
@@ -85,17 +110,17 @@ class TestEventCRUD:
         assert count == 2
 
     async def test_snooze_limit_25(self, db_path):
-        """Incrementing snooze 25 times should work; 26th increment goes beyond limit."""
+        """Incrementing snooze to 25 works; the 26th goes beyond the limit."""
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Test",
             notes=None,
             path=db_path,
         )
-        for i in range(25):
-            count = await database.increment_snooze(eid, path=db_path)
+        await _bump_snooze(eid, 24, db_path)
+        count = await database.increment_snooze(eid, path=db_path)
         assert count == 25
         # 26th
         count = await database.increment_snooze(eid, path=db_path)
@@ -105,7 +130,7 @@ class TestEventCRUD:
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Owner task",
             notes=None,
             path=db_path,
@@ -119,7 +144,7 @@ class TestEventCRUD:
         await database.upsert_user(222, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Owner task",
             notes=None,
             path=db_path,
@@ -131,7 +156,7 @@ class TestEventCRUD:
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Deleted task",
             notes=None,
             path=db_path,
@@ -144,7 +169,7 @@ class TestEventCRUD:
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Task",
             notes="Note",
             path=db_path,
@@ -159,7 +184,7 @@ class TestEventCRUD:
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Old",
             notes="Note",
             path=db_path,
@@ -167,14 +192,14 @@ class TestEventCRUD:
         await database.update_event_activity(eid, "New", path=db_path)
         event = await database.get_event(eid, path=db_path)
         assert event["activity"] == "New"
-        assert event["event_dt"] == "2025-12-25T18:00:00+03:00"
+        assert event["event_dt"] == EVT_DT
         assert event["notes"] == "Note"
 
     async def test_update_event_notes_only(self, db_path):
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
         eid = await database.create_event(
             user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
+            event_dt=EVT_DT,
             activity="Task",
             notes="Old note",
             path=db_path,
@@ -185,7 +210,7 @@ class TestEventCRUD:
         assert event["activity"] == "Task"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestWeekEvents:
     async def test_get_week_events(self, db_path):
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
@@ -233,17 +258,10 @@ class TestWeekEvents:
         assert len(events) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestJobsCRUD:
     async def test_create_and_get_jobs(self, db_path):
-        await database.upsert_user(111, "Europe/Moscow", path=db_path)
-        eid = await database.create_event(
-            user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
-            activity="Test",
-            notes=None,
-            path=db_path,
-        )
+        eid = await _seed_user_event(db_path)
         jid = await database.create_job(
             event_id=eid,
             job_type="hour_before",
@@ -256,14 +274,7 @@ class TestJobsCRUD:
         assert jobs[0]["scheduler_job_id"] == "sched_123"
 
     async def test_delete_jobs(self, db_path):
-        await database.upsert_user(111, "Europe/Moscow", path=db_path)
-        eid = await database.create_event(
-            user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
-            activity="Test",
-            notes=None,
-            path=db_path,
-        )
+        eid = await _seed_user_event(db_path)
         await database.create_job(eid, "hour_before", "2025-12-25T17:00:00", "j1", path=db_path)
         await database.create_job(eid, "day_before", "2025-12-24T12:00:00", "j2", path=db_path)
         deleted_ids = await database.delete_jobs_for_event(eid, path=db_path)
@@ -272,35 +283,21 @@ class TestJobsCRUD:
         assert len(remaining) == 0
 
     async def test_get_all_active_jobs(self, db_path):
-        await database.upsert_user(111, "Europe/Moscow", path=db_path)
-        eid = await database.create_event(
-            user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
-            activity="Test",
-            notes=None,
-            path=db_path,
-        )
+        eid = await _seed_user_event(db_path)
         await database.create_job(eid, "hour_before", "2025-12-25T17:00:00", "j1", path=db_path)
         all_jobs = await database.get_all_jobs(path=db_path)
         assert len(all_jobs) == 1
         assert all_jobs[0]["event_status"] == "active"
 
     async def test_done_event_jobs_excluded(self, db_path):
-        await database.upsert_user(111, "Europe/Moscow", path=db_path)
-        eid = await database.create_event(
-            user_id=111,
-            event_dt="2025-12-25T18:00:00+03:00",
-            activity="Test",
-            notes=None,
-            path=db_path,
-        )
+        eid = await _seed_user_event(db_path)
         await database.create_job(eid, "hour_before", "2025-12-25T17:00:00", "j1", path=db_path)
         await database.update_event_status(eid, "done", path=db_path)
         all_jobs = await database.get_all_jobs(path=db_path)
         assert len(all_jobs) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestUndoAndDuplicates:
     async def test_create_and_get_undo_action(self, db_path):
         await database.upsert_user(111, "Europe/Moscow", path=db_path)
@@ -401,7 +398,7 @@ class TestUndoAndDuplicates:
         assert len(dupes_excluding_first) == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestMetrics:
     async def test_increment_metric_creates_row(self, db_path):
         await database.increment_metric("create_success", day_utc="2026-03-04", path=db_path)
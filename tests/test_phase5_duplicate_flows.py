@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
 import handlers.event_edit as event_edit
 import handlers.task_browser as browser
 import handlers.wizard as wizard
+from tests.conftest import TZ
 
 
 class _FakeState:
@@ -158,7 +158,7 @@ async def test_clone_success_schedules_jobs(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_edit_datetime_duplicate_guard_blocks_save(monkeypatch):
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     tomorrow = (datetime.now(tz) + timedelta(days=1)).date().isoformat()
     state = _FakeState(
         {
@@ -193,7 +193,7 @@ async def test_edit_datetime_duplicate_guard_blocks_save(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_edit_datetime_duplicate_override_saves(monkeypatch):
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     tomorrow = (datetime.now(tz) + timedelta(days=1)).date().isoformat()
     state = _FakeState(
         {
@@ -210,14 +210,18 @@ async def test_edit_datetime_duplicate_override_saves(monkeypatch):
     async def _update_dt(event_id, event_dt):
         called["update"] = (event_id, event_dt)
 
+    async def _update_notes(event_id, notes):
+        pass
+
     async def _cancel_jobs(event_id):
         called["cancel"] = event_id
 
-    async def _schedule(event_id, event_dt, user_id):
+    async def _schedule(event_id, event_dt, user_id, now=None):
         called["schedule"] = (event_id, event_dt, user_id)
 
     monkeypatch.setattr(event_edit.database, "get_active_event_for_user", _get_event)
     monkeypatch.setattr(event_edit.database, "update_event_datetime", _update_dt)
+    monkeypatch.setattr(event_edit.database, "update_event_notes", _update_notes)
     monkeypatch.setattr(event_edit, "cancel_event_jobs", _cancel_jobs)
     monkeypatch.setattr(event_edit, "schedule_event_jobs", _schedule)
 
@@ -1,13 +1,13 @@
 """Tests for unified preview formatter."""
 
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
 from handlers.texts import format_event_preview
+from tests.conftest import TZ
 
 
 def test_preview_contains_absolute_datetime_and_timezone():
-    dt = datetime(2026, 7, 2, 18, 30, tzinfo=ZoneInfo("Europe/Moscow"))
+    dt = datetime(2026, 7, 2, 18, 30, tzinfo=TZ)
     text = format_event_preview(
         dt=dt,
         activity="Тренировка",
@@ -19,7 +19,7 @@ def test_preview_contains_absolute_datetime_and_timezone():
 
 
 def test_preview_contains_only_datetime_and_activity():
-    dt = datetime(2026, 7, 2, 18, 30, tzinfo=ZoneInfo("Europe/Moscow"))
+    dt = datetime(2026, 7, 2, 18, 30, tzinfo=TZ)
     text = format_event_preview(
         dt=dt,
         activity="Тренировка",
@@ -1,25 +1,53 @@
 """Tests for scheduler job computation and snooze logic."""
 
 import pytest
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import datetime
 
+import scheduler
 from scheduler import compute_job_times, _reminder_text
-
-TZ = ZoneInfo("Europe/Moscow")
+from tests.conftest import TZ
 
 
 class TestComputeJobTimes:
-    def test_day_before_and_hour_before_and_at_time(self):
-        """Event > 24h away: should get day_before, hour_before, at_time."""
-        now = datetime(2025, 6, 10, 10, 0, tzinfo=TZ)
-        event_dt = datetime(2025, 6, 12, 18, 0, tzinfo=TZ)
+    @pytest.mark.parametrize(
+        ("now", "event_dt", "expected_types"),
+        [
+            pytest.param(
+                datetime(2025, 6, 10, 10, 0, tzinfo=TZ),
+                datetime(2025, 6, 12, 18, 0, tzinfo=TZ),
+                ["day_before", "hour_before", "at_time"],
+                id="more_than_24h_away",
+            ),
+            pytest.param(
+                datetime(2025, 6, 12, 10, 0, tzinfo=TZ),
+                datetime(2025, 6, 12, 18, 0, tzinfo=TZ),
+                ["hour_before", "at_time"],
+                id="day_before_already_past",
+            ),
+            pytest.param(
+                datetime(2025, 6, 12, 17, 30, tzinfo=TZ),
+                datetime(2025, 6, 12, 18, 0, tzinfo=TZ),
+                ["at_time"],
+                id="within_60_minutes",
+            ),
+            pytest.param(
+                datetime(2025, 6, 12, 17, 0, tzinfo=TZ),
+                datetime(2025, 6, 12, 18, 0, tzinfo=TZ),
+                ["at_time"],
+                id="exactly_60_minutes",
+            ),
+            pytest.param(
+                datetime(2025, 6, 12, 19, 0, tzinfo=TZ),
+                datetime(2025, 6, 12, 18, 0, tzinfo=TZ),
+                [],
+                id="past_event",
+            ),
+        ],
+    )
+    def test_job_types(self, now, event_dt, expected_types):
+        """Which reminders are scheduled depends only on the delta to the event."""
         jobs = compute_job_times(event_dt, now)
-        types = [j[0] for j in jobs]
-        assert "day_before" in types
-        assert "hour_before" in types
-        assert "at_time" in types
-        assert "soon" not in types
+        assert [j[0] for j in jobs] == expected_types
 
     def test_day_before_at_noon(self):
         """Day-before job should be at 12:00 the day before."""
@@ -30,26 +58,6 @@ class TestComputeJobTimes:
         assert len(day_before) == 1
         assert day_before[0][1].hour == 12
 
-    def test_hour_before_and_at_time(self):
-        """Event 2-24h away, but day_before is in the past: hour_before + at_time."""
-        now = datetime(2025, 6, 12, 10, 0, tzinfo=TZ)
-        event_dt = datetime(2025, 6, 12, 18, 0, tzinfo=TZ)
-        jobs = compute_job_times(event_dt, now)
-        types = [j[0] for j in jobs]
-        assert "day_before" not in types
-        assert "hour_before" in types
-        assert "at_time" in types
-
-    def test_only_at_time_for_event_within_60_minutes(self):
-        """Event < 60 min away: schedule only at_time."""
-        now = datetime(2025, 6, 12, 17, 30, tzinfo=TZ)
-        event_dt = datetime(2025, 6, 12, 18, 0, tzinfo=TZ)
-        jobs = compute_job_times(event_dt, now)
-        types = [j[0] for j in jobs]
-        assert "at_time" in types
-        assert len(types) == 1
-        assert "hour_before" not in types
-
     def test_at_time_fires_at_event_dt(self):
         """at_time job run_dt must equal event_dt exactly."""
         now = datetime(2025, 6, 10, 10, 0, tzinfo=TZ)
@@ -59,30 +67,11 @@ class TestComputeJobTimes:
         assert len(at_time) == 1
         assert at_time[0][1] == event_dt
 
-    def test_exactly_60_minutes_schedules_only_at_time(self):
-        """Boundary at exactly 60 minutes: only at_time."""
-        now = datetime(2025, 6, 12, 17, 0, tzinfo=TZ)
-        event_dt = datetime(2025, 6, 12, 18, 0, tzinfo=TZ)
-        jobs = compute_job_times(event_dt, now)
-        types = [j[0] for j in jobs]
-        assert types == ["at_time"]
-
-    def test_past_event_no_jobs(self):
-        """Event in the past: no jobs."""
-        now = datetime(2025, 6, 12, 19, 0, tzinfo=TZ)
-        event_dt = datetime(2025, 6, 12, 18, 0, tzinfo=TZ)
-        jobs = compute_job_times(event_dt, now)
-        assert jobs == []
-
 
 class TestSnoozeLimit:
     def test_snooze_max_is_25(self):
-        """The snooze limit is 25; this is enforced at the DB/scheduler level.
-        Here we just verify the constant is correct in usage context."""
-        MAX_SNOOZE = 25
-        assert MAX_SNOOZE == 25
-        assert 25 >= MAX_SNOOZE
-        assert 24 < MAX_SNOOZE
+        """The product-level snooze cap lives in scheduler.MAX_SNOOZE."""
+        assert scheduler.MAX_SNOOZE == 25
 
 
 class TestReminderText:
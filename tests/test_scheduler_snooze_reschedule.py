@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
 import scheduler
+from tests.conftest import TZ
 
 
 @pytest.mark.asyncio
 async def test_schedule_snooze_reschedules_event_timeline(monkeypatch):
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     fixed_now = datetime(2026, 3, 4, 10, 0, tzinfo=tz)
     calls = {"update": None, "cancel": None, "schedule": None, "order": []}
 
@@ -21,7 +21,7 @@ async def test_schedule_snooze_reschedules_event_timeline(monkeypatch):
         def now(cls, tz=None):  # noqa: D401
             return fixed_now
 
-    async def _get_event(event_id, path="bot.db"):
+    async def _get_event(event_id, path="bot.db", only_active=False):
         return {"id": event_id, "user_id": 111, "status": "active", "snooze_count": 0}
 
     async def _inc(event_id, path="bot.db"):
@@ -61,7 +61,7 @@ async def test_schedule_snooze_reschedules_event_timeline(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_repeated_snooze_keeps_single_timeline_path(monkeypatch):
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     now_values = [
         datetime(2026, 3, 4, 10, 0, tzinfo=tz),
         datetime(2026, 3, 4, 11, 30, tzinfo=tz),
@@ -75,7 +75,7 @@ async def test_repeated_snooze_keeps_single_timeline_path(monkeypatch):
         def now(cls, tz=None):  # noqa: D401
             return now_values.pop(0)
 
-    async def _get_event(event_id, path="bot.db"):
+    async def _get_event(event_id, path="bot.db", only_active=False):
         return {"id": event_id, "user_id": 111, "status": "active", "snooze_count": 0}
 
     async def _inc(event_id, path="bot.db"):
@@ -2,29 +2,26 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 import pytest_asyncio
 
 import db as database
 from handlers.task_browser import _bounds_for_filter
+from tests.conftest import TZ
 
 
 @pytest_asyncio.fixture
-async def db_path():
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
+async def db_path(tmp_path):
+    path = str(tmp_path / "test.db")
     await database.init_db(path)
     yield path
-    os.unlink(path)
+    await database.close_db()
 
 
 def test_today_filter_bounds():
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     now = datetime(2026, 3, 4, 15, 20, tzinfo=tz)
     start, end = _bounds_for_filter("today", now)
     assert start.endswith("00:00:00+03:00")
@@ -32,7 +29,7 @@ def test_today_filter_bounds():
 
 
 def test_tomorrow_filter_bounds():
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     now = datetime(2026, 3, 4, 15, 20, tzinfo=tz)
     start, end = _bounds_for_filter("tomorrow", now)
     assert start.startswith("2026-03-05T00:00:00")
@@ -40,7 +37,7 @@ def test_tomorrow_filter_bounds():
 
 
 def test_week_filter_bounds():
-    tz = ZoneInfo("Europe/Moscow")
+    tz = TZ
     now = datetime(2026, 3, 4, 15, 20, tzinfo=tz)  # Wednesday
     start, end = _bounds_for_filter("week", now)
     assert start.startswith("2026-03-04T15:20:00")
@@ -54,7 +51,7 @@ async def test_all_filter_returns_all_active(db_path):
     for i in range(3):
         await database.create_event(
             user_id=111,
-            event_dt=(datetime(2026, 3, 10, 10, 0, tzinfo=ZoneInfo("Europe/Moscow")) + timedelta(days=i)).isoformat(),
+            event_dt=(datetime(2026, 3, 10, 10, 0, tzinfo=TZ) + timedelta(days=i)).isoformat(),
             activity=f"A{i}",
             notes=None,
             path=db_path,
@@ -62,7 +59,7 @@ async def test_all_filter_returns_all_active(db_path):
 
     deleted = await database.create_event(
         user_id=111,
-        event_dt=datetime(2026, 3, 20, 10, 0, tzinfo=ZoneInfo("Europe/Moscow")).isoformat(),
+        event_dt=datetime(2026, 3, 20, 10, 0, tzinfo=TZ).isoformat(),
         activity="Deleted",
         notes=None,
         path=db_path,
@@ -2,31 +2,28 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 import pytest_asyncio
 
 import db as database
 import handlers.task_browser as browser
+from tests.conftest import TZ
 
 
 @pytest_asyncio.fixture
-async def db_path():
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
+async def db_path(tmp_path):
+    path = str(tmp_path / "test.db")
     await database.init_db(path)
     yield path
-    os.unlink(path)
+    await database.close_db()
 
 
 @pytest.mark.asyncio
 async def test_page_size_five(db_path):
     await database.upsert_user(111, "Europe/Moscow", path=db_path)
-    base = datetime(2026, 3, 10, 10, 0, tzinfo=ZoneInfo("Europe/Moscow"))
+    base = datetime(2026, 3, 10, 10, 0, tzinfo=TZ)
 
     for i in range(7):
         await database.create_event(
@@ -44,7 +41,7 @@ async def test_page_size_five(db_path):
 @pytest.mark.asyncio
 async def test_page_clamping_low(db_path, monkeypatch):
     await database.upsert_user(111, "Europe/Moscow", path=db_path)
-    base = datetime(2026, 3, 10, 10, 0, tzinfo=ZoneInfo("Europe/Moscow"))
+    base = datetime(2026, 3, 10, 10, 0, tzinfo=TZ)
 
     for i in range(6):
         await database.create_event(
@@ -82,7 +79,7 @@ async def test_page_clamping_low(db_path, monkeypatch):
 @pytest.mark.asyncio
 async def test_page_clamping_high(db_path, monkeypatch):
     await database.upsert_user(111, "Europe/Moscow", path=db_path)
-    base = datetime(2026, 3, 10, 10, 0, tzinfo=ZoneInfo("Europe/Moscow"))
+    base = datetime(2026, 3, 10, 10, 0, tzinfo=TZ)
 
     for i in range(6):
         await database.create_event(
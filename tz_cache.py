@@ -0,0 +1,16 @@
+"""Cached ZoneInfo construction shared by handlers and the scheduler."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=64)
+def get_zone(name: str) -> ZoneInfo:
+    """Return a ZoneInfo for ``name``, memoized per tz string.
+
+    ZoneInfo construction reads tzdata from disk; users stick to a handful
+    of timezones, so caching avoids that cost on every message.
+    """
+    return ZoneInfo(name)